@@ -27,17 +27,36 @@ moves; pass --dry-run to only print the corresponding mv commands. Use
 """
 
 import argparse
+import errno
+import gzip
+import heapq
+import http.client
 import json
 import os
 import shutil
+import sqlite3
+import subprocess
 import sys
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.error import HTTPError
+
+try:
+    import orjson  # much faster on large payloads, if installed
+except ImportError:
+    orjson = None
 
 
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 7125
 DEFAULT_ENDPOINT = "/server/database/item?namespace=gcode_metadata"
+DEFAULT_CACHE = "~/.cache/gcode-archiver.sqlite"
+
+# filename -> (modified, print_start_time); values come straight from JSON
+# and are validated in compute_recency_seconds
+TimestampMap = Dict[str, Tuple[Any, Any]]
 
 
 def build_url(host: str, port: int, endpoint: str) -> str:
@@ -46,77 +65,354 @@ def build_url(host: str, port: int, endpoint: str) -> str:
     return f"http://{host}:{port}{ep}"
 
 
-def fetch_json(url: str, timeout_seconds: float) -> dict:
-    """Fetch a URL and parse its JSON payload.
+# Keep-alive connections keyed by (host, port), reused across fetches so that
+# repeated calls (polling, multiple endpoints) skip the TCP handshake
+_connections = {}
+
+
+def get_connection(host: str, port: int, timeout_seconds: float) -> http.client.HTTPConnection:
+    """Return a pooled keep-alive connection to host:port, creating it on first use."""
+    key = (host, port)
+    connection = _connections.get(key)
+    if connection is None:
+        connection = http.client.HTTPConnection(host, port, timeout=timeout_seconds)
+        _connections[key] = connection
+    return connection
 
-    Raises an exception if the HTTP request fails or the payload is not valid JSON.
+
+def fetch_json(
+    host: str,
+    port: int,
+    endpoint: str,
+    timeout_seconds: float,
+    extra_headers: Optional[Dict[str, str]] = None,
+) -> Tuple[Any, Message]:
+    """Fetch a Moonraker endpoint and parse its JSON payload.
+
+    Uses a pooled keep-alive connection so repeat fetches reuse the same socket.
+    Returns (payload, response_headers); payload is None when the server
+    answers 304 Not Modified (only possible when extra_headers carry
+    conditional-request validators). Raises an exception if the HTTP request
+    fails or the payload is not valid JSON.
     """
-    request = Request(url, headers={"Accept": "application/json"})
-    with urlopen(request, timeout=timeout_seconds) as response:
-        # Prefer server-declared charset; default to utf-8
-        charset = response.headers.get_content_charset() or "utf-8"
-        raw_text = response.read().decode(charset, errors="replace")
+    path = endpoint if endpoint.startswith("/") else "/" + endpoint
+    # Metadata JSON is highly redundant (repeated keys, base64 thumbnails);
+    # compression typically shrinks the transfer several-fold
+    headers = {"Accept": "application/json", "Accept-Encoding": "gzip, deflate"}
+    if extra_headers:
+        headers.update(extra_headers)
+    connection = get_connection(host, port, timeout_seconds)
+    try:
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+    except (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError):
+        # The server closed an idle keep-alive connection; reconnect once
+        connection.close()
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+
+    # Drain the body even on errors so the connection stays reusable
+    raw_bytes = response.read()
+    if response.status == 304 and extra_headers:
+        # Only meaningful as an answer to the validators we sent; an
+        # unsolicited 304 falls through to the error path below
+        return None, response.headers
+    if response.status >= 400:
+        raise HTTPError(
+            build_url(host, port, endpoint), response.status, response.reason, response.headers, None
+        )
+
+    content_encoding = (response.headers.get("Content-Encoding") or "").lower()
+    if content_encoding == "gzip":
+        raw_bytes = gzip.decompress(raw_bytes)
+    elif content_encoding == "deflate":
+        try:
+            raw_bytes = zlib.decompress(raw_bytes)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib wrapper
+            raw_bytes = zlib.decompress(raw_bytes, -zlib.MAX_WBITS)
 
     try:
-        return json.loads(raw_text)
-    except json.JSONDecodeError as exc:
-        snippet = raw_text[:2000]
+        if orjson is not None:
+            return orjson.loads(raw_bytes), response.headers
+        # Both parsers take bytes directly: JSON is UTF-8 by spec (RFC 8259)
+        # and json.loads sniffs the encoding itself, so decoding to str first
+        # would just be an extra full pass over the payload
+        return json.loads(raw_bytes), response.headers
+    except ValueError as exc:
+        # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
+        snippet = raw_bytes[:2000]
         raise RuntimeError(
             f"Response was not valid JSON: {exc}. Partial body: {snippet!r}"
         ) from exc
 
 
-def unwrap_moonraker_result(payload):
-    """Moonraker commonly wraps results inside a 'result' field.
+def extract_gcode_index(payload: Any) -> Any:
+    """Return a mapping of filename -> metadata from a Moonraker response.
 
-    This function unwraps that layer if present, otherwise returns the payload unchanged.
+    Moonraker database item responses typically wrap the mapping twice:
+      { "result": { "namespace": "gcode_metadata", "key": null, "value": { ...files... } } }
+    Both layers are optional and peeled off in one pass; the payload itself is
+    returned if it already looks like a filename->metadata mapping.
     """
     if isinstance(payload, dict) and "result" in payload:
-        return payload["result"]
+        payload = payload["result"]
+    if isinstance(payload, dict):
+        value = payload.get("value")
+        if isinstance(value, dict):
+            return value
     return payload
 
 
-def extract_gcode_index(content):
-    """Return a mapping of filename -> metadata from Moonraker content.
+def reduce_gcode_index(filename_to_metadata: Dict[str, Any]) -> TimestampMap:
+    """Strip each file's metadata down to the two fields recency needs.
 
-    Moonraker database item responses typically look like:
-      { "namespace": "gcode_metadata", "key": null, "value": { ...files... } }
-    This function returns that inner value if present, else the content itself
-    if it already looks like a filename->metadata mapping.
+    Moonraker metadata entries carry plenty we never look at (slicer settings,
+    thumbnails, per-object data); keeping only a (modified, print_start_time)
+    tuple per file lets the full payload be garbage-collected right after
+    parsing instead of living until the moves are done, and avoids allocating
+    a throwaway dict per entry.
     """
-    if isinstance(content, dict) and "value" in content and isinstance(content["value"], dict):
-        return content["value"]
-    return content
+    reduced = {}
+    for filename, metadata in filename_to_metadata.items():
+        if isinstance(metadata, dict):
+            reduced[filename] = (metadata.get("modified"), metadata.get("print_start_time"))
+        else:
+            reduced[filename] = (None, None)
+    return reduced
+
+
+def fetch_gcode_entries(
+    host: str,
+    port: int,
+    endpoint: str,
+    timeout_seconds: float,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> Tuple[Optional[TimestampMap], Optional[str], Optional[str]]:
+    """Fetch gcode metadata and return (entries, etag, last_modified).
+
+    entries is a slim filename -> timestamps mapping, or None if validators
+    were given and the server answered 304 Not Modified (If-Modified-Since
+    covers servers that don't emit ETags). Fetching, unwrapping, and reducing
+    happen in one place so the raw payload (often tens of MB with embedded
+    thumbnails) goes out of scope here rather than being held for the rest of
+    the run.
+    """
+    extra_headers = {}
+    if etag:
+        extra_headers["If-None-Match"] = etag
+    if last_modified:
+        extra_headers["If-Modified-Since"] = last_modified
+    payload, response_headers = fetch_json(host, port, endpoint, timeout_seconds, extra_headers or None)
+    if payload is None:
+        return None, etag, last_modified
+    filename_to_metadata = extract_gcode_index(payload)
+    if not isinstance(filename_to_metadata, dict):
+        raise RuntimeError("Unexpected payload format: expected a mapping of filename to metadata")
+    entries = reduce_gcode_index(filename_to_metadata)
+    return entries, response_headers.get("ETag"), response_headers.get("Last-Modified")
 
 
-def compute_recency_seconds(file_metadata: dict) -> float:
-    """Determine the recency metric for a file as max(modified, print_start_time)."""
-    modified = file_metadata.get("modified")
-    started = file_metadata.get("print_start_time")
-    candidates = [t for t in (modified, started) if isinstance(t, (int, float))]
-    if not candidates:
-        return -1.0
-    return float(max(candidates))
+def open_metadata_cache(path: str) -> Optional[sqlite3.Connection]:
+    """Open (creating if needed) the sidecar cache; returns None if unusable.
+
+    The cache is strictly an optimization: any failure here means the run
+    proceeds with a full fetch, never an error.
+    """
+    try:
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        cache = sqlite3.connect(path)
+        cache.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        cache.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "filename TEXT PRIMARY KEY, modified REAL, print_start_time REAL)"
+        )
+        cache.commit()
+        return cache
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def read_cached_state(
+    cache: sqlite3.Connection, url: str
+) -> Tuple[Optional[str], Optional[str], Optional[TimestampMap]]:
+    """Return (etag, last_modified, entries) from the cache, or Nones if unusable.
+
+    The cached rows are only valid for the URL they were fetched from; a
+    changed host/port/endpoint invalidates them.
+    """
+    try:
+        meta = dict(cache.execute("SELECT key, value FROM meta"))
+        if meta.get("url") != url:
+            return None, None, None
+        entries = {
+            filename: (modified, started)
+            for filename, modified, started in cache.execute(
+                "SELECT filename, modified, print_start_time FROM files"
+            )
+        }
+        return meta.get("etag"), meta.get("last_modified"), entries
+    except sqlite3.Error:
+        return None, None, None
+
+
+def store_cached_state(
+    cache: sqlite3.Connection,
+    url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    entries: TimestampMap,
+) -> None:
+    """Replace the cached rows and validators after a successful fetch."""
+    try:
+        with cache:
+            cache.execute("DELETE FROM files")
+            cache.executemany(
+                "INSERT INTO files (filename, modified, print_start_time) VALUES (?, ?, ?)",
+                ((filename, modified, started) for filename, (modified, started) in entries.items()),
+            )
+            cache.execute("DELETE FROM meta")
+            cache.execute("INSERT INTO meta (key, value) VALUES ('url', ?)", (url,))
+            if etag:
+                cache.execute("INSERT INTO meta (key, value) VALUES ('etag', ?)", (etag,))
+            if last_modified:
+                cache.execute("INSERT INTO meta (key, value) VALUES ('last_modified', ?)", (last_modified,))
+    except sqlite3.Error:
+        pass
+
+
+def compute_recency_seconds(modified: Any, started: Any) -> float:
+    """Determine the recency metric for a file as max(modified, print_start_time).
+
+    Deliberately branch-lean: non-numeric values collapse to the -1.0
+    sentinel ("unknown, archive first") and the max is a single comparison,
+    with no intermediate list, max() call, or isinstance MRO walk. This runs
+    once per file and is the hottest pure-Python spot in the scoring pass.
+    """
+    a = modified if type(modified) is float or type(modified) is int else -1.0
+    b = started if type(started) is float or type(started) is int else -1.0
+    return a if a >= b else b
 
 
-def select_keep_and_archive(filename_to_metadata: dict, keep_count: int):
+def select_keep_and_archive(
+    filename_to_timestamps: TimestampMap, keep_count: Optional[int]
+) -> Tuple[List[Tuple[str, float]], List[Tuple[str, float]]]:
     """Return (keep_list, archive_list) based on recency descending.
 
-    Each list item is a (filename, recency_seconds) tuple.
-    """
-    scored = []
-    for filename, metadata in filename_to_metadata.items():
-        recency = compute_recency_seconds(metadata if isinstance(metadata, dict) else {})
-        scored.append((filename, recency))
+    Input values are (modified, print_start_time) tuples as produced by
+    reduce_gcode_index. Each output list item is a (filename, recency_seconds)
+    tuple. The keep list is ordered newest first; the archive list keeps the
+    input order (its ordering is cosmetic only).
 
-    # Newest first, unknown timestamps at the end (recency=-1)
-    scored.sort(key=lambda item: item[1], reverse=True)
+    Selection works on two parallel arrays (names and recencies) and picks
+    integer indices, so the sort/heap shuffles machine ints with a C-level
+    list lookup as the key instead of churning (name, recency) tuples.
+    """
+    names = list(filename_to_timestamps)
+    # Comprehension with a local binding keeps the per-file bytecode minimal
+    _recency = compute_recency_seconds
+    recencies = [_recency(modified, started) for modified, started in filename_to_timestamps.values()]
+
+    count = len(names)
+    keep_count = max(keep_count, 0) if keep_count is not None else count
+
+    # When keeping at least half the files a full sort is cheaper than a heap;
+    # otherwise nlargest does O(N log K) work instead of O(N log N)
+    if keep_count * 2 >= count:
+        # Newest first, unknown timestamps at the end (recency=-1); stable on
+        # ties, so equal recencies stay in input order
+        order = sorted(range(count), key=recencies.__getitem__, reverse=True)
+        keep_indices = order[:keep_count]
+        archive_indices = order[keep_count:]
+    else:
+        keep_indices = heapq.nlargest(keep_count, range(count), key=recencies.__getitem__)
+        kept = set(keep_indices)
+        archive_indices = [i for i in range(count) if i not in kept]
 
-    keep = scored[: max(keep_count, 0)] if keep_count is not None else scored
-    archive = scored[max(keep_count, 0) :] if keep_count is not None else []
+    keep = [(names[i], recencies[i]) for i in keep_indices]
+    archive = [(names[i], recencies[i]) for i in archive_indices]
     return keep, archive
 
 
+def list_existing_files(gcode_dir: str) -> Optional[Set[str]]:
+    """Return the set of plain filenames present in gcode_dir.
+
+    Moonraker's database often keeps records for files that were deleted from
+    disk; one scandir pass up front lets those ghost entries be skipped
+    without a failed move syscall each. Returns None if the directory can't
+    be scanned, in which case callers skip the pre-filter and the moves
+    report per-file as before.
+    """
+    try:
+        with os.scandir(gcode_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return None
+
+
+# Cap the argv length of one mv invocation well below ARG_MAX
+MV_BATCH_SIZE = 500
+
+
+def same_filesystem(path_a: str, path_b: str) -> bool:
+    """True if both paths are on the same device (so rename works across them)."""
+    try:
+        return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+    except OSError:
+        return False
+
+
+def batch_move(names: List[str], src_prefix: str, archive_dir: str) -> Tuple[List[str], List[str]]:
+    """Move names into archive_dir with one mv invocation per batch.
+
+    A single `mv -t` amortizes the Python-level per-file work when archiving
+    many same-filesystem files. Returns (moved, retry): names confirmed moved,
+    and names from failed batches that the caller should retry one by one so
+    the per-file error reporting stays precise.
+    """
+    moved: List[str] = []
+    retry: List[str] = []
+    for start in range(0, len(names), MV_BATCH_SIZE):
+        chunk = names[start : start + MV_BATCH_SIZE]
+        result = subprocess.run(
+            ["mv", "-t", archive_dir] + [src_prefix + name for name in chunk],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if result.returncode == 0:
+            moved.extend(chunk)
+        else:
+            # mv may have moved part of the chunk before failing; whatever is
+            # gone from the source side made it, the rest gets retried one by
+            # one so error reporting stays precise
+            for name in chunk:
+                if os.path.exists(src_prefix + name):
+                    retry.append(name)
+                else:
+                    moved.append(name)
+    return moved, retry
+
+
+def move_file(src: str, dst: str) -> None:
+    """Move src to dst, preferring a plain rename over copy+delete.
+
+    In the common setup the archive dir lives on the same filesystem as the
+    gcode dir (usually a subdirectory), so a single rename(2) suffices and no
+    file data is copied. Only fall back to shutil.move when the rename fails
+    because src and dst are on different devices.
+    """
+    try:
+        os.rename(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        # Cross-device: shutil.move copies then deletes
+        shutil.move(src, dst)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Fetch Moonraker gcode_metadata; optionally compute keep/archive sets"
@@ -150,6 +446,12 @@ def main() -> int:
         default=os.path.expanduser("~/printer_data/gcodes/archive"),
         help="Directory to move archived files into (default: ~/printer_data/gcodes/archive)",
     )
+    parser.add_argument(
+        "--cache",
+        default=DEFAULT_CACHE,
+        help="Sidecar cache for skipping refetches when metadata is unchanged "
+        "(default: ~/.cache/gcode-archiver.sqlite; pass an empty string to disable)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -162,64 +464,124 @@ def main() -> int:
     )
     args = parser.parse_args()
 
+    # A valid cache entry lets us send a conditional request and skip the
+    # multi-MB payload entirely when nothing changed on the server
+    url = build_url(args.host, args.port, args.endpoint)
+    cache = open_metadata_cache(os.path.expanduser(args.cache)) if args.cache else None
+    etag = last_modified = cached_entries = None
+    if cache is not None:
+        etag, last_modified, cached_entries = read_cached_state(cache, url)
+        if not cached_entries:
+            # Without rows to fall back on, a 304 would leave us empty-handed
+            etag = last_modified = None
+
     # Always fetch from the Moonraker server
     try:
-        url = build_url(args.host, args.port, args.endpoint)
-        payload = fetch_json(url, args.timeout)
+        filename_to_metadata, new_etag, new_last_modified = fetch_gcode_entries(
+            args.host, args.port, args.endpoint, args.timeout, etag=etag, last_modified=last_modified
+        )
     except HTTPError as exc:
         print(f"HTTP error: {exc.code} {exc.reason}", file=sys.stderr)
         return 2
-    except URLError as exc:
-        print(f"Connection error: {exc.reason}", file=sys.stderr)
+    except (OSError, http.client.HTTPException) as exc:
+        print(f"Connection error: {exc}", file=sys.stderr)
         return 2
     except Exception as exc:  # noqa: BLE001 - CLI entrypoint
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
-    content = unwrap_moonraker_result(payload)
-    # Build keep/archive sets
-    filename_to_metadata = extract_gcode_index(content)
-    if not isinstance(filename_to_metadata, dict):
-        print("Unexpected payload format: expected a mapping of filename to metadata", file=sys.stderr)
-        return 1
+    if filename_to_metadata is None:
+        # 304 Not Modified: score the cached entries instead
+        if args.verbose:
+            print("Metadata unchanged on server (HTTP 304); using cached entries")
+        filename_to_metadata = cached_entries
+    elif cache is not None:
+        store_cached_state(cache, url, new_etag, new_last_modified, filename_to_metadata)
 
+    # Build keep/archive sets
     keep, archive = select_keep_and_archive(filename_to_metadata, args.keep)
 
+    gcode_dir = os.path.expanduser(args.gcode_dir)
+    archive_dir = os.path.expanduser(args.archive_dir)
+
+    # Drop ghost entries (metadata for files no longer on disk) before moving
+    # or reporting them. Subdirectory names aren't in the top-level scan, so
+    # those are left for the move itself to sort out.
+    existing = list_existing_files(gcode_dir)
+    if existing is not None:
+        archive = [item for item in archive if item[0] in existing or os.sep in item[0]]
+        if args.verbose:
+            keep = [item for item in keep if item[0] in existing or os.sep in item[0]]
+
     if args.verbose:
-        print(f"Recency metric = max(modified, print_start_time)")
-        print(f"Keeping {len(keep)} files:")
-        for name, recency in keep:
-            print(f"  KEEP   {recency:.3f}  {name}")
-        print("")
-        print(f"Archiving {len(archive)} files:")
-        for name, recency in archive:
+        # Batch the listing into one write; a print() per line flushes
+        # line-buffered stdout for every file
+        lines = ["Recency metric = max(modified, print_start_time)"]
+        lines.append(f"Keeping {len(keep)} files:")
+        lines.extend(f"  KEEP   {recency:.3f}  {name}" for name, recency in keep)
+        lines.append("")
+        lines.append(f"Archiving {len(archive)} files:")
+        lines.extend(
             # For unknown times, recency will be -1
-            if recency < 0:
-                print(f"  ARCH   unknown   {name}")
-            else:
-                print(f"  ARCH   {recency:.3f}  {name}")
+            f"  ARCH   unknown   {name}" if recency < 0 else f"  ARCH   {recency:.3f}  {name}"
+            for name, recency in archive
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Print or execute move commands
-    gcode_dir = os.path.expanduser(args.gcode_dir)
-    archive_dir = os.path.expanduser(args.archive_dir)
     print("")
     if not args.dry_run:
         if args.verbose:
             print(f"Executing moves to archive: {archive_dir}")
-        for name, _ in archive:
-            src = os.path.join(gcode_dir, name)
-            dst = os.path.join(archive_dir, name)
-            dst_parent = os.path.dirname(dst)
+
+        # The directories are loop-invariant: pre-join the prefixes once and
+        # remember which archive subdirs have been created already
+        src_prefix = gcode_dir.rstrip(os.sep) + os.sep
+        dst_prefix = archive_dir.rstrip(os.sep) + os.sep
+        created_dirs = set()
+
+        def move_one(name: str) -> Optional[str]:
+            """Move one file and return the message to print for it (or None)."""
+            src = src_prefix + name
+            dst = dst_prefix + name
             try:
-                os.makedirs(dst_parent, exist_ok=True)
-                # Use shutil.move for robustness across filesystems
-                shutil.move(src, dst)
-                print(f"moved: {src} -> {dst}")
+                # Filenames may contain subdirectories; archive_dir itself
+                # already exists at this point
+                parent = os.path.dirname(name)
+                if parent and parent not in created_dirs:
+                    os.makedirs(dst_prefix + parent, exist_ok=True)
+                    created_dirs.add(parent)
+                move_file(src, dst)
+                return f"moved: {src} -> {dst}"
             except FileNotFoundError:
-                if args.verbose:
-                    print(f"skip (missing): {src}")
+                return f"skip (missing): {src}" if args.verbose else None
             except Exception as exc:  # noqa: BLE001 - CLI entrypoint
-                print(f"error moving {src} -> {dst}: {exc}")
+                return f"error moving {src} -> {dst}: {exc}"
+
+        if archive:
+            os.makedirs(archive_dir, exist_ok=True)
+            names = [name for name, _ in archive]
+
+            # Same-filesystem archives can be batched through a single mv
+            # invocation; subdirectory names need their parent created first,
+            # so they stay on the per-file path
+            singles = names
+            if shutil.which("mv") and same_filesystem(gcode_dir, archive_dir):
+                batchable = [name for name in names if os.sep not in name]
+                singles = [name for name in names if os.sep in name]
+                moved, retry = batch_move(batchable, src_prefix, archive_dir)
+                for name in moved:
+                    print(f"moved: {src_prefix + name} -> {dst_prefix + name}")
+                singles = retry + singles
+
+            if singles:
+                # Threads overlap the move syscalls (CPython releases the GIL
+                # around them); executor.map keeps the printed output in
+                # submit order and on the main thread
+                with ThreadPoolExecutor(max_workers=min(8, len(singles))) as executor:
+                    for message in executor.map(move_one, singles):
+                        if message:
+                            print(message)
     else:
         if args.verbose:
             print("Dry run. The following commands would be executed:")